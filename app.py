@@ -1,11 +1,12 @@
 import streamlit as st
+import io
 import os
 import math
+import re
 from collections import OrderedDict
 import pandas as pd
 from datetime import time
 from src.models.route_models import StopModel
-from src.optimization.route_optimizer import RouteOptimizer
 
 st.set_page_config(
     page_title="NES Van Route Optimizer",
@@ -16,6 +17,10 @@ st.set_page_config(
 
 MAX_VAN_CAPACITY = 10
 
+def normalize_address(addr):
+    """Normalize an address for comparison (collapse whitespace, lowercase, strip trailing periods)"""
+    return re.sub(r'\s+', ' ', str(addr).strip().lower()).rstrip('.')
+
 def is_wheelchair(val):
     if pd.isnull(val):
         return False
@@ -182,7 +187,17 @@ def main():
     )
     if master_file is not None:
         try:
-            master_df = pd.read_csv(master_file)
+            file_bytes = master_file.getvalue()
+            try:
+                # Arrow parses the file in a single pass into columnar storage
+                # (faster and leaner than the default C engine with dtype inference)
+                master_df = pd.read_csv(
+                    io.BytesIO(file_bytes),
+                    engine='pyarrow',
+                    dtype_backend='pyarrow',
+                )
+            except (ImportError, ValueError):
+                master_df = pd.read_csv(io.BytesIO(file_bytes))
             master_df.columns = [col.lower() for col in master_df.columns]
             st.success(f" Loaded {len(master_df)} individuals from master list.")
             # Step 2: Select individuals for today (checkbox grid)
@@ -221,6 +236,11 @@ def main():
 
             if selected_names:
                 selected_df = master_df[master_df['name'].isin(selected_names)].copy()
+                # Canonicalize addresses so "123 Main St" and "123 Main St." share one stop
+                # (keeps the first spelling seen for display, avoids duplicate API calls downstream)
+                selected_df['address'] = selected_df.groupby(
+                    selected_df['address'].map(normalize_address)
+                )['address'].transform('first')
                 # Prepare for optimization: split into wheelchair and regular
                 selected_df['is_wheelchair'] = selected_df['wheelchair'].apply(is_wheelchair)
                 wheelchair_df = selected_df[selected_df['is_wheelchair']]
@@ -319,6 +339,10 @@ def main():
 
                     with st.spinner(" Optimizing routes..."):
                         try:
+                            # Imported here so OR-Tools/requests only load when the user
+                            # actually optimizes, keeping cold app startup fast
+                            from src.optimization.route_optimizer import RouteOptimizer
+
                             # Initialize optimizer with API key
                             # Force utilization logic REMOVED to avoid strict bin-packing failures
                             forced_capacity = MAX_VAN_CAPACITY
@@ -1,28 +1,35 @@
-from typing import List, Optional
 from datetime import time, datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict
 
 class IndividualModel(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     name: str
     address: str
     wheelchair: bool
 
 class StopModel(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     address: str
-    passengers: List[str]  # List of names
+    passengers: list[str]  # List of names
     wheelchair: bool = False
 
 class RouteRequest(BaseModel):
-    stops: List[StopModel]
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+    stops: list[StopModel]
     depot_address: str
     number_of_vans: int = 2
     start_time: time = time(8, 0)
 
 class RouteResponse(BaseModel):
-    stops: List[StopModel]
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+    stops: list[StopModel]
     total_distance: float
     total_time: int
-    route_sequence: List[int]
-    etas: List[datetime]
+    route_sequence: list[int]
+    etas: list[datetime]
     is_feasible: bool
-    optimization_time: float 
\ No newline at end of file
+    optimization_time: float
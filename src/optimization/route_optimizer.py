@@ -3,17 +3,381 @@ NES Van Route Optimization Engine
 Real OR-Tools TSP/VRP implementation with Google Maps API integration
 """
 
+import asyncio
+import hashlib
+import json
 import logging
 import os
+import re
+import shelve
 import requests
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import List, Optional, Tuple, Dict, Any
 from ortools.constraint_solver import routing_enums_pb2
 from ortools.constraint_solver import pywrapcp
 
 from src.models.route_models import StopModel
+from src.services.matrix_cache import EdgeCache
+
+# Optional: one event loop handles the HTTP fan-out with less overhead than a
+# thread per request; the threaded path below remains the fallback
+try:
+    import aiohttp  # type: ignore
+except ImportError:
+    aiohttp = None
+
+# Optional: ~2-3x faster JSON decode of the Maps payloads; the stdlib
+# decoder produces the identical dict/list tree when orjson is missing
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+
+def _json_loads(data: bytes) -> Any:
+    """Decode a raw JSON response body with the fastest available decoder"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# On-disk caches shared across optimizer instances and process restarts
+_GEOCODE_CACHE_PATH = os.path.join(".cache", "geocode")
+_MATRIX_CACHE_PATH = os.path.join(".cache", "matrix")
+
+
+def _matrix_cache_key(coords: List[Tuple[float, float]]) -> str:
+    """Digest of the ordered, rounded coordinate list (order matters: it fixes
+    the row/column layout of the cached matrices)"""
+    arr = np.round(np.asarray(coords, dtype=np.float64), 6)
+    return hashlib.blake2b(arr.tobytes()).hexdigest()
+
+
+def _normalize_address(address: str) -> str:
+    """Normalize an address string for cache keying (lowercase, collapsed whitespace)"""
+    return re.sub(r"\s+", " ", address.strip().lower())
+
+
+@lru_cache(maxsize=4)
+def _validate_api_key(api_key: str) -> str:
+    """Strip and sanity-check an API key; memoized so the per-character scan
+    runs once per distinct key instead of once per service instantiation"""
+    key = api_key.strip()
+    if not key:
+        raise ValueError("Google Maps API key not provided. Please set GOOGLE_MAPS_API_KEY environment variable or secrets.")
+    # Basic sanitation to avoid hidden control chars
+    if any((ord(c) < 32) for c in key):
+        raise ValueError("Google Maps API key contains invalid characters. Paste a clean plain-text key.")
+    return key
+
+
+_SESSION: Optional[requests.Session] = None
+
+
+def _shared_session() -> requests.Session:
+    """Process-wide keep-alive session: service instances are created per
+    optimizer (one per web request), but TCP/TLS connections survive them"""
+    global _SESSION
+    if _SESSION is None:
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[500, 502, 503, 504],
+            ),
+        ))
+        _SESSION = session
+    return _SESSION
+
+
+# Sentinel cost for unreachable location pairs; large enough that the solver
+# never picks such an arc, small enough not to overflow int32 sums
+_UNREACHABLE = 999999
+
+# Above this node count, prune the billable matrix to each node's nearest
+# neighbors (by great-circle distance); good solutions never use the far arcs
+_KNN_PRUNE_MIN_NODES = 30
+_KNN_NEIGHBORS = 10
+
+
+def _haversine_km_matrix(coords: List[Tuple[float, float]]) -> np.ndarray:
+    """Vectorized great-circle distances (km) between all coordinate pairs"""
+    arr = np.asarray(coords, dtype=np.float64)
+    lats = np.radians(arr[:, 0])
+    lngs = np.radians(arr[:, 1])
+    dlat = lats[:, None] - lats[None, :]
+    dlng = lngs[:, None] - lngs[None, :]
+    a = (np.sin(dlat / 2) ** 2
+         + np.cos(lats[:, None]) * np.cos(lats[None, :]) * np.sin(dlng / 2) ** 2)
+    return 2.0 * 6371.0 * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def _sanitize_matrices(
+    distance_matrix,
+    duration_matrix
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert the Optional-valued matrices to int32 views of one contiguous
+    (n, n, 2) block, substituting the sentinel for unreachable pairs, so neither
+    the solver nor the extraction path branches on None per cell and both
+    matrices share a single dense allocation"""
+    # Matrices from the Maps service already arrive dense and sentinel-filled
+    if isinstance(distance_matrix, np.ndarray) and isinstance(duration_matrix, np.ndarray):
+        return (
+            distance_matrix.astype(np.int32, copy=False),
+            duration_matrix.astype(np.int32, copy=False),
+        )
+    n = len(distance_matrix)
+    block = np.full((n, n, 2), _UNREACHABLE, dtype=np.int32)
+    for i, (row_d, row_t) in enumerate(zip(distance_matrix, duration_matrix)):
+        block[i, :, 0] = [_UNREACHABLE if d is None else int(d) for d in row_d]
+        block[i, :, 1] = [_UNREACHABLE if t is None else int(t) for t in row_t]
+    return block[..., 0], block[..., 1]
+
+
+# Below this size, OR-Tools setup costs more than the solve itself and a
+# direct nearest-neighbor + 2-opt tour is effectively optimal
+_SMALL_TSP_MAX_STOPS = 10
+
+
+def _small_tsp_route(duration_matrix: np.ndarray) -> List[int]:
+    """
+    Build a depot-to-depot tour with greedy nearest neighbor, then improve it
+    with 2-opt until no reversal shortens the tour (bounded passes).
+    """
+    n = duration_matrix.shape[0]
+    unvisited = set(range(1, n))
+    route = [0]
+    while unvisited:
+        last = route[-1]
+        nearest = min(unvisited, key=lambda j: duration_matrix[last, j])
+        route.append(nearest)
+        unvisited.remove(nearest)
+    route.append(0)
+
+    improved = True
+    passes = 0
+    while improved and passes < 50:
+        improved = False
+        passes += 1
+        for i in range(1, len(route) - 2):
+            for j in range(i + 1, len(route) - 1):
+                a, b = route[i - 1], route[i]
+                c, d = route[j], route[j + 1]
+                if (int(duration_matrix[a, c]) + int(duration_matrix[b, d])
+                        < int(duration_matrix[a, b]) + int(duration_matrix[c, d])):
+                    route[i:j + 1] = route[i:j + 1][::-1]
+                    improved = True
+    return route
+
+
+# First-solution strategies run concurrently by the multi-start search;
+# the RoutingModel itself is single-threaded, so idle cores are spent on
+# independent restarts instead
+_PORTFOLIO_STRATEGIES = (
+    routing_enums_pb2.FirstSolutionStrategy.PATH_CHEAPEST_ARC,
+    routing_enums_pb2.FirstSolutionStrategy.SAVINGS,
+    routing_enums_pb2.FirstSolutionStrategy.CHRISTOFIDES,
+    routing_enums_pb2.FirstSolutionStrategy.PARALLEL_CHEAPEST_INSERTION,
+)
+
+
+def _extract_route_nodes(routing, manager, solution, vehicle_id: int, buf: np.ndarray) -> np.ndarray:
+    """Walk one vehicle's assignment chain into the preallocated buffer.
+
+    Returns an int32 view of the visited nodes including both depot
+    endpoints; edge sums over it are a single fancy-index reduction.
+    """
+    k = 0
+    index = routing.Start(vehicle_id)
+    while not routing.IsEnd(index):
+        buf[k] = manager.IndexToNode(index)
+        k += 1
+        index = solution.Value(routing.NextVar(index))
+    buf[k] = manager.IndexToNode(index)
+    return buf[:k + 1]
+
+
+def _solve_tsp_candidate(
+    duration_matrix: List[List[int]],
+    strategy: int,
+    time_limit_s: int,
+    regular_demands: Optional[List[int]] = None,
+    max_regular: Optional[int] = None
+) -> Optional[Tuple[int, List[int]]]:
+    """
+    Solve one single-vehicle instance with the given first-solution strategy.
+
+    Module-level so ProcessPoolExecutor can pickle it. Returns a tuple of
+    (objective_value, route_node_sequence), or None if no solution was found.
+    """
+    n = len(duration_matrix)
+    manager = pywrapcp.RoutingIndexManager(n, 1, 0)
+    # Cache every arc cost so the solver never recomputes one during search,
+    # and collapse identical per-vehicle cost structures
+    model_params = pywrapcp.DefaultRoutingModelParameters()
+    model_params.reduce_vehicle_cost_model = True
+    model_params.max_callback_cache_size = max(n * n, 2048)
+    routing = pywrapcp.RoutingModel(manager, model_params)
+
+    transit_callback_index = routing.RegisterTransitMatrix(duration_matrix)
+    routing.SetArcCostEvaluatorOfAllVehicles(transit_callback_index)
+
+    if regular_demands is not None and max_regular is not None:
+        regular_demand_index = routing.RegisterUnaryTransitVector(regular_demands)
+        routing.AddDimensionWithVehicleCapacity(
+            regular_demand_index,
+            0,
+            [max_regular],
+            True,
+            'RegularFrontSeat'
+        )
+
+    search_parameters = pywrapcp.DefaultRoutingSearchParameters()
+    search_parameters.first_solution_strategy = strategy
+    search_parameters.local_search_metaheuristic = (
+        routing_enums_pb2.LocalSearchMetaheuristic.GUIDED_LOCAL_SEARCH)
+    search_parameters.time_limit.seconds = time_limit_s
+    # Return promptly on easy instances instead of burning the full budget
+    search_parameters.log_search = False
+    search_parameters.solution_limit = 200
+    search_parameters.lns_time_limit.seconds = 1
+
+    # Bound-based early stop: every node must be departed exactly once, so
+    # the tour can never cost less than the sum of minimum outgoing arcs.
+    # Once a solution lands within 2% of that bound, further search cannot
+    # repay its time budget, so end it instead of waiting out the limit.
+    try:
+        arr = np.asarray(duration_matrix, dtype=np.int64)
+        np.fill_diagonal(arr, np.iinfo(np.int32).max)
+        lower_bound = int(arr.min(axis=1).sum())
+        if 0 < lower_bound < _UNREACHABLE:
+            threshold = int(lower_bound * 1.02)
+            solver = routing.solver()
+            cost_var = routing.CostVar()
+
+            def _stop_when_near_bound():
+                if cost_var.Value() <= threshold:
+                    solver.FinishCurrentSearch()
+
+            routing.AddAtSolutionCallback(_stop_when_near_bound)
+    except Exception as e:
+        logger.debug(f"Lower-bound early stop unavailable: {e}")
+
+    solution = routing.SolveWithParameters(search_parameters)
+    if not solution:
+        return None
+
+    # Preallocated buffer: a route visits at most all n nodes plus the
+    # closing depot, so no list reallocation is needed while walking
+    route_buf = np.empty(n + 1, dtype=np.int32)
+    nodes = _extract_route_nodes(routing, manager, solution, 0, route_buf)
+    return solution.ObjectiveValue(), nodes.tolist()
+
+_VRP_PORTFOLIO_STRATEGIES = (
+    routing_enums_pb2.FirstSolutionStrategy.PARALLEL_CHEAPEST_INSERTION,
+    routing_enums_pb2.FirstSolutionStrategy.SAVINGS,
+    routing_enums_pb2.FirstSolutionStrategy.CHRISTOFIDES,
+    routing_enums_pb2.FirstSolutionStrategy.LOCAL_CHEAPEST_INSERTION,
+)
+
+
+def _solve_vrp_candidate(
+    duration_matrix: List[List[int]],
+    num_vehicles: int,
+    vehicle_capacity: int,
+    demands: List[int],
+    regular_demands: Optional[List[int]],
+    max_regular: Optional[int],
+    strategy: int,
+    time_limit_s: int
+) -> Optional[Tuple[int, List[List[int]]]]:
+    """
+    Solve one multi-vehicle instance with the given first-solution strategy.
+
+    Module-level so ProcessPoolExecutor can pickle it. Returns a tuple of
+    (objective_value, per-vehicle node routes), or None if no solution.
+    """
+    n = len(duration_matrix)
+    manager = pywrapcp.RoutingIndexManager(n, num_vehicles, 0)
+    # Cache every arc cost so the solver never recomputes one during
+    # search; all vans share one cost evaluator, which is exactly the
+    # case reduce_vehicle_cost_model collapses
+    model_params = pywrapcp.DefaultRoutingModelParameters()
+    model_params.reduce_vehicle_cost_model = True
+    model_params.max_callback_cache_size = max(n * n, 2048)
+    routing = pywrapcp.RoutingModel(manager, model_params)
+
+    transit_callback_index = routing.RegisterTransitMatrix(duration_matrix)
+    routing.SetArcCostEvaluatorOfAllVehicles(transit_callback_index)
+
+    demand_callback_index = routing.RegisterUnaryTransitVector(demands)
+    routing.AddDimensionWithVehicleCapacity(
+        demand_callback_index,
+        0,  # null capacity slack
+        [vehicle_capacity] * num_vehicles,
+        True,  # start cumul to zero
+        'Capacity'
+    )
+
+    # Balance drive time across vans via a Time dimension with a realistic
+    # horizon: no route outlasts an 8-hour shift, and no route can exceed
+    # the worst leg times the node count, so cumul domains stay tight
+    arr = np.asarray(duration_matrix, dtype=np.int64)
+    finite = arr[arr < _UNREACHABLE]
+    max_leg_s = int(finite.max()) if finite.size else 0
+    horizon = min(8 * 3600, max(1, max_leg_s) * n)
+    routing.AddDimension(
+        transit_callback_index,
+        0,  # no slack
+        horizon,  # per-vehicle drive-time cap
+        True,  # start cumul to zero
+        'Time'
+    )
+    time_dimension = routing.GetDimensionOrDie('Time')
+    time_dimension.SetGlobalSpanCostCoefficient(100)
+    for vehicle_id in range(num_vehicles):
+        time_dimension.CumulVar(routing.End(vehicle_id)).SetRange(0, horizon)
+
+    if regular_demands is not None and max_regular is not None:
+        regular_demand_index = routing.RegisterUnaryTransitVector(regular_demands)
+        routing.AddDimensionWithVehicleCapacity(
+            regular_demand_index,
+            0,
+            [max_regular] * num_vehicles,
+            True,
+            'RegularFrontSeat'
+        )
+
+    search_parameters = pywrapcp.DefaultRoutingSearchParameters()
+    search_parameters.first_solution_strategy = strategy
+    search_parameters.local_search_metaheuristic = (
+        routing_enums_pb2.LocalSearchMetaheuristic.GUIDED_LOCAL_SEARCH)
+    search_parameters.time_limit.seconds = time_limit_s
+    # Return promptly on easy instances instead of burning the full budget
+    search_parameters.log_search = False
+    search_parameters.solution_limit = 200
+    search_parameters.lns_time_limit.seconds = 1
+
+    solution = routing.SolveWithParameters(search_parameters)
+    if not solution:
+        return None
+
+    route_buf = np.empty(n + 1, dtype=np.int32)
+    routes = [
+        _extract_route_nodes(routing, manager, solution, vehicle_id, route_buf).tolist()
+        for vehicle_id in range(num_vehicles)
+    ]
+    return solution.ObjectiveValue(), routes
+
+
 class RouteOptimizer:
     """Main optimization engine using OR-Tools with Google Maps API"""
 
@@ -29,16 +393,23 @@ class RouteOptimizer:
             Args:
                 api_key: Google Maps API key (optional, will use env var if not provided)
             """
-            self.api_key = (api_key or os.getenv("GOOGLE_MAPS_API_KEY") or "").strip()
-            if not self.api_key:
-                raise ValueError("Google Maps API key not provided. Please set GOOGLE_MAPS_API_KEY environment variable or secrets.")
-            # Basic sanitation to avoid hidden control chars
-            if any((ord(c) < 32) for c in self.api_key):
-                raise ValueError("Google Maps API key contains invalid characters. Paste a clean plain-text key.")
+            self.api_key = _validate_api_key(api_key or os.getenv("GOOGLE_MAPS_API_KEY") or "")
 
             self.base_url = "https://maps.googleapis.com/maps/api/geocode/json"
             self.distance_matrix_url = "https://maps.googleapis.com/maps/api/distancematrix/json"
 
+            # Module-level session: keep-alive avoids a TLS handshake per
+            # request, the pool is sized for the concurrent geocode/matrix
+            # fan-out, and connections outlive the per-request service instance
+            self.session = _shared_session()
+            # Per-service memo keyed on normalized address, so repeated lookups
+            # within a process never re-issue HTTP even when callers bypass the
+            # optimizer-level persistent cache
+            self._geo_cache: Dict[str, Tuple[float, float]] = {}
+            # Per-edge persistent cache: editing one stop only pays the API
+            # for edges touching the new coordinate, not the whole matrix
+            self._edge_cache = EdgeCache()
+
         def geocode_address(self, address: str) -> Tuple[float, float]:
             """
             Geocode a single address.
@@ -52,13 +423,18 @@ class RouteOptimizer:
             Raises:
                 ValueError: If geocoding fails or returns no results.
             """
+            cache_key = _normalize_address(address)
+            cached = self._geo_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
             params = {
                 "address": address,
                 "key": self.api_key
             }
-            response = requests.get(self.base_url, params=params)
+            response = self.session.get(self.base_url, params=params, timeout=(5, 30))
             response.raise_for_status()
-            results = response.json().get("results")
+            results = _json_loads(response.content).get("results")
             if not results:
                 raise ValueError(f"No results found for address: {address}")
 
@@ -66,9 +442,60 @@ class RouteOptimizer:
             if not location:
                 raise ValueError(f"Location not found in results for address: {address}")
 
-            lat = location["lat"]
-            lng = location["lng"]
-            return (lat, lng)
+            coords = (location["lat"], location["lng"])
+            self._geo_cache[cache_key] = coords
+            return coords
+
+        async def _geocode_address_async(
+            self,
+            session: "aiohttp.ClientSession",
+            address: str
+        ) -> Tuple[float, float]:
+            """Async twin of geocode_address sharing the same memo"""
+            cache_key = _normalize_address(address)
+            cached = self._geo_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+            params = {
+                "address": address,
+                "key": self.api_key
+            }
+            async with session.get(self.base_url, params=params) as resp:
+                resp.raise_for_status()
+                payload = _json_loads(await resp.read())
+            results = payload.get("results")
+            if not results:
+                raise ValueError(f"No results found for address: {address}")
+
+            location = results[0].get("geometry", {}).get("location")
+            if not location:
+                raise ValueError(f"Location not found in results for address: {address}")
+
+            coords = (location["lat"], location["lng"])
+            self._geo_cache[cache_key] = coords
+            return coords
+
+        async def geocode_addresses_async(
+            self,
+            addresses: List[str]
+        ) -> List[Optional[Tuple[float, float]]]:
+            """Geocode many addresses on one event loop; failures map to None"""
+            connector = aiohttp.TCPConnector(limit=32)
+            timeout = aiohttp.ClientTimeout(total=30)
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+                results = await asyncio.gather(
+                    *(self._geocode_address_async(session, a) for a in addresses),
+                    return_exceptions=True
+                )
+            coords: List[Optional[Tuple[float, float]]] = []
+            for address, result in zip(addresses, results):
+                if isinstance(result, BaseException):
+                    logger.warning(f"Could not geocode address '{address}': {result}")
+                    coords.append(None)
+                else:
+                    coords.append(result)
+            return coords
 
         def geocode_addresses(self, addresses: List[str]) -> List[Optional[Tuple[float, float]]]:
             """
@@ -80,21 +507,35 @@ class RouteOptimizer:
             Returns:
                 List of tuples (latitude, longitude) or None if geocoding fails.
             """
-            geocoded_coords = []
-            for address in addresses:
+            if not addresses:
+                return []
+
+            # Prefer the event-loop fan-out: one loop instead of a thread per
+            # in-flight request. Falls through to threads when aiohttp is
+            # missing or a loop is already running on this thread.
+            if aiohttp is not None:
+                try:
+                    return asyncio.run(self.geocode_addresses_async(addresses))
+                except RuntimeError:
+                    pass
+
+            def geocode_or_none(address):
                 try:
-                    coords = self.geocode_address(address)
-                    geocoded_coords.append(coords)
+                    return self.geocode_address(address)
                 except ValueError as e:
                     logger.warning(f"Could not geocode address '{address}': {e}")
-                    geocoded_coords.append(None)
-            return geocoded_coords
+                    return None
+
+            # Fan the lookups out over the shared keep-alive session; map()
+            # preserves input order
+            with ThreadPoolExecutor(max_workers=min(12, len(addresses))) as executor:
+                return list(executor.map(geocode_or_none, addresses))
 
         def get_route_optimization_matrix(
             self,
             depot_coords: Tuple[float, float],
             stop_coords: List[Tuple[float, float]]
-        ) -> Tuple[List[List[Optional[int]]], List[List[Optional[int]]]]:
+        ) -> Tuple[np.ndarray, np.ndarray]:
             """
             Get distance and duration matrices from Google Maps Distance Matrix API.
 
@@ -107,24 +548,131 @@ class RouteOptimizer:
             """
             # Build full [depot + stops] x [depot + stops] matrices via chunked HTTP calls
             all_coords: List[Tuple[float, float]] = [depot_coords] + stop_coords
-            return self.get_distance_matrix(all_coords, all_coords)
+
+            # For large fleets, only pay for element pairs a good solution
+            # could actually use: each node's k nearest neighbors by
+            # great-circle distance, plus everything touching the depot.
+            # Unrequested pairs keep the unreachable sentinel.
+            needed = None
+            n = len(all_coords)
+            if n > _KNN_PRUNE_MIN_NODES:
+                km = _haversine_km_matrix(all_coords)
+                k = min(_KNN_NEIGHBORS, n - 1)
+                neighbors = np.argpartition(km, k, axis=1)[:, :k + 1]
+                needed = np.zeros((n, n), dtype=bool)
+                rows = np.repeat(np.arange(n), neighbors.shape[1])
+                needed[rows, neighbors.ravel()] = True
+                needed |= needed.T  # keep candidate arcs usable in both directions
+                needed[0, :] = True
+                needed[:, 0] = True
+
+            return self.get_distance_matrix(all_coords, all_coords, needed=needed)
+
+        def _fetch_block(
+            self,
+            block: Tuple[int, int, int, int],
+            origin_strs_all: List[str],
+            dest_strs_all: List[str],
+            departure_time: Optional[str]
+        ) -> Tuple[Tuple[int, int, int, int], List[Dict[str, Any]]]:
+            """Fetch one (row, col) block of the distance matrix; retries with
+            backoff come from the session adapter"""
+            row_start, row_end, col_start, col_end = block
+
+            params: Dict[str, Any] = {
+                "origins": "|".join(origin_strs_all[row_start:row_end]),
+                "destinations": "|".join(dest_strs_all[col_start:col_end]),
+                "mode": "driving",
+                "units": "imperial",
+                "key": self.api_key,
+            }
+            if departure_time:
+                params["departure_time"] = departure_time
+
+            # (connect, read) split: fail fast on a dead connection while
+            # still allowing a slow large response to stream in
+            resp = self.session.get(self.distance_matrix_url, params=params, timeout=(5, 30))
+            resp.raise_for_status()
+            result = _json_loads(resp.content)
+            if result.get("status") != "OK":
+                raise ValueError(f"Distance Matrix API returned status: {result.get('status')} {result.get('error_message','')}")
+            return block, result.get("rows", [])
+
+        async def _fetch_block_async(
+            self,
+            session: "aiohttp.ClientSession",
+            block: Tuple[int, int, int, int],
+            origin_strs_all: List[str],
+            dest_strs_all: List[str],
+            departure_time: Optional[str]
+        ) -> Tuple[Tuple[int, int, int, int], List[Dict[str, Any]]]:
+            """Async twin of _fetch_block; retries transient failures with
+            exponential backoff on the event loop"""
+            row_start, row_end, col_start, col_end = block
+
+            params: Dict[str, Any] = {
+                "origins": "|".join(origin_strs_all[row_start:row_end]),
+                "destinations": "|".join(dest_strs_all[col_start:col_end]),
+                "mode": "driving",
+                "units": "imperial",
+                "key": self.api_key,
+            }
+            if departure_time:
+                params["departure_time"] = departure_time
+
+            last_error: Optional[Exception] = None
+            for attempt in range(3):
+                try:
+                    async with session.get(self.distance_matrix_url, params=params) as resp:
+                        resp.raise_for_status()
+                        result = _json_loads(await resp.read())
+                    break
+                except aiohttp.ClientError as e:
+                    last_error = e
+                    await asyncio.sleep(0.3 * 2 ** attempt)
+            else:
+                raise ValueError(f"Distance Matrix request failed after retries: {last_error}")
+
+            if result.get("status") != "OK":
+                raise ValueError(f"Distance Matrix API returned status: {result.get('status')} {result.get('error_message','')}")
+            return block, result.get("rows", [])
+
+        async def _fetch_blocks_async(
+            self,
+            blocks: List[Tuple[int, int, int, int]],
+            origin_strs_all: List[str],
+            dest_strs_all: List[str],
+            departure_time: Optional[str]
+        ) -> List[Tuple[Tuple[int, int, int, int], List[Dict[str, Any]]]]:
+            """Fetch every block concurrently on one event loop"""
+            connector = aiohttp.TCPConnector(limit=32)
+            timeout = aiohttp.ClientTimeout(total=30)
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+                return await asyncio.gather(
+                    *(self._fetch_block_async(session, b, origin_strs_all, dest_strs_all, departure_time)
+                      for b in blocks)
+                )
 
         def get_distance_matrix(
             self,
             origins: List[Tuple[float, float]],
             destinations: List[Tuple[float, float]],
-            departure_time: Optional[str] = None
-        ) -> Tuple[List[List[Optional[int]]], List[List[Optional[int]]]]:
+            departure_time: Optional[str] = None,
+            needed: Optional[np.ndarray] = None
+        ) -> Tuple[np.ndarray, np.ndarray]:
             try:
                 num_origins = len(origins)
                 num_destinations = len(destinations)
 
-                distance_matrix: List[List[Optional[int]]] = [
-                    [None for _ in range(num_destinations)] for _ in range(num_origins)
-                ]
-                duration_matrix: List[List[Optional[int]]] = [
-                    [None for _ in range(num_destinations)] for _ in range(num_origins)
-                ]
+                # Dense int32 matrices, pre-filled with the unreachable
+                # sentinel: ~8x smaller than nested lists of boxed ints and
+                # contiguous for the solver and extraction paths
+                distance_matrix = np.full(
+                    (num_origins, num_destinations), _UNREACHABLE, dtype=np.int32
+                )
+                duration_matrix = np.full(
+                    (num_origins, num_destinations), _UNREACHABLE, dtype=np.int32
+                )
 
                 max_elements = 100
                 rows_chunk = min(num_origins, 25)
@@ -133,41 +681,86 @@ class RouteOptimizer:
                     cols_chunk = max_elements // rows_chunk
                     cols_chunk = max(1, cols_chunk)
 
+                # Serve already-known edges from the persistent per-edge cache
+                # before any HTTP; only pairs still missing (and needed, when a
+                # mask is given) cost billable elements
+                missing = np.ones((num_origins, num_destinations), dtype=bool)
+                if needed is not None:
+                    missing &= needed
+                for i in range(num_origins):
+                    for j in range(num_destinations):
+                        if not missing[i, j]:
+                            continue
+                        hit = self._edge_cache.lookup(origins[i], destinations[j])
+                        if hit is not None:
+                            distance_matrix[i, j], duration_matrix[i, j] = hit
+                            missing[i, j] = False
+
+                # Tile the full matrix into blocks within the per-request element
+                # limit; blocks whose pairs are all cached or unneeded are never
+                # requested
+                blocks = []
                 for row_start in range(0, num_origins, rows_chunk):
                     row_end = min(num_origins, row_start + rows_chunk)
-                    origin_block = origins[row_start:row_end]
-                    origin_strs = [f"{lat},{lng}" for lat, lng in origin_block]
-
                     for col_start in range(0, num_destinations, cols_chunk):
                         col_end = min(num_destinations, col_start + cols_chunk)
-                        dest_block = destinations[col_start:col_end]
-                        dest_strs = [f"{lat},{lng}" for lat, lng in dest_block]
-
-                        params: Dict[str, Any] = {
-                            "origins": "|".join(origin_strs),
-                            "destinations": "|".join(dest_strs),
-                            "mode": "driving",
-                            "units": "imperial",
-                            "key": self.api_key,
-                        }
-                        if departure_time:
-                            params["departure_time"] = departure_time
-
-                        resp = requests.get(self.distance_matrix_url, params=params, timeout=30)
-                        resp.raise_for_status()
-                        result = resp.json()
-                        if result.get("status") != "OK":
-                            raise ValueError(f"Distance Matrix API returned status: {result.get('status')} {result.get('error_message','')}")
-
-                        for i_row, row in enumerate(result.get("rows", [])):
-                            elements = row.get("elements", [])
-                            for j_col, element in enumerate(elements):
-                                if element.get("status") == "OK":
-                                    distance_matrix[row_start + i_row][col_start + j_col] = element["distance"]["value"]
-                                    duration_matrix[row_start + i_row][col_start + j_col] = element["duration"]["value"]
-                                else:
-                                    distance_matrix[row_start + i_row][col_start + j_col] = None
-                                    duration_matrix[row_start + i_row][col_start + j_col] = None
+                        if not missing[row_start:row_end, col_start:col_end].any():
+                            continue
+                        blocks.append((row_start, row_end, col_start, col_end))
+
+                # Format every coordinate exactly once; blocks slice these.
+                # Fixed 6-decimal rounding also keeps the API input canonical,
+                # matching the per-edge cache key resolution.
+                origin_strs_all = [f"{lat:.6f},{lng:.6f}" for lat, lng in origins]
+                dest_strs_all = [f"{lat:.6f},{lng:.6f}" for lat, lng in destinations]
+
+                def fetch_block(block):
+                    return self._fetch_block(block, origin_strs_all, dest_strs_all, departure_time)
+
+                # Fetch blocks concurrently — on one event loop when aiohttp is
+                # available, otherwise up to 8 threads over the pooled session;
+                # stitching happens on the calling thread so the matrices need
+                # no locking
+                block_results = None
+                if aiohttp is not None and blocks:
+                    try:
+                        block_results = asyncio.run(
+                            self._fetch_blocks_async(blocks, origin_strs_all, dest_strs_all, departure_time)
+                        )
+                    except RuntimeError:
+                        block_results = None
+                if block_results is None:
+                    with ThreadPoolExecutor(max_workers=8) as executor:
+                        block_results = list(executor.map(fetch_block, blocks))
+
+                new_edges = []
+                for block, rows in block_results:
+                    row_start, row_end, col_start, col_end = block
+                    n_rows = row_end - row_start
+                    n_cols = col_end - col_start
+                    # Flatten the block in one comprehension, then mask and
+                    # write whole slices: no per-cell matrix indexing or
+                    # status branch inside nested Python loops
+                    pairs = [
+                        (e.get("distance", {}).get("value"),
+                         e.get("duration", {}).get("value"))
+                        for row in rows
+                        for e in row.get("elements", [])
+                    ]
+                    vals = np.array(pairs, dtype=object).reshape(n_rows, n_cols, 2)
+                    ok = np.not_equal(vals[..., 0], None) & np.not_equal(vals[..., 1], None)
+                    d_block = np.where(ok, vals[..., 0], _UNREACHABLE).astype(np.int32)
+                    t_block = np.where(ok, vals[..., 1], _UNREACHABLE).astype(np.int32)
+                    distance_matrix[row_start:row_end, col_start:col_end] = d_block
+                    duration_matrix[row_start:row_end, col_start:col_end] = t_block
+                    for i_row, j_col in np.argwhere(ok):
+                        new_edges.append((
+                            origins[row_start + i_row],
+                            destinations[col_start + j_col],
+                            int(d_block[i_row, j_col]),
+                            int(t_block[i_row, j_col]),
+                        ))
+                self._edge_cache.store_many(new_edges)
 
                 return distance_matrix, duration_matrix
             except Exception as e:
@@ -186,6 +779,46 @@ class RouteOptimizer:
         self.depot_address = depot_address
         self.vehicle_capacity = vehicle_capacity
         self.gmaps_service = self.GoogleMapsService(api_key)
+        self._geo_cache: Dict[str, Tuple[float, float]] = {}
+        self._load_geocode_cache()
+
+    def _load_geocode_cache(self) -> None:
+        """Warm the in-memory geocode cache from the on-disk store, if present"""
+        try:
+            os.makedirs(os.path.dirname(_GEOCODE_CACHE_PATH), exist_ok=True)
+            with shelve.open(_GEOCODE_CACHE_PATH) as db:
+                self._geo_cache.update(db)
+        except Exception as e:
+            logger.warning(f"Could not load geocode cache: {e}")
+
+    def _save_geocode_cache(self, new_entries: Dict[str, Tuple[float, float]]) -> None:
+        """Persist newly geocoded addresses so repeat runs skip the API entirely"""
+        if not new_entries:
+            return
+        try:
+            with shelve.open(_GEOCODE_CACHE_PATH) as db:
+                for key, coords in new_entries.items():
+                    db[key] = coords
+        except Exception as e:
+            logger.warning(f"Could not persist geocode cache: {e}")
+
+    def _load_matrix_cache(self, key: str):
+        """Return cached (distance_matrix, duration_matrix) for a coordinate set, or None"""
+        try:
+            os.makedirs(os.path.dirname(_MATRIX_CACHE_PATH), exist_ok=True)
+            with shelve.open(_MATRIX_CACHE_PATH) as db:
+                return db.get(key)
+        except Exception as e:
+            logger.warning(f"Could not load matrix cache: {e}")
+            return None
+
+    def _save_matrix_cache(self, key: str, matrices) -> None:
+        """Persist the fetched matrices so identical re-runs skip the API"""
+        try:
+            with shelve.open(_MATRIX_CACHE_PATH) as db:
+                db[key] = matrices
+        except Exception as e:
+            logger.warning(f"Could not persist matrix cache: {e}")
 
     def optimize_route(
         self,
@@ -237,10 +870,68 @@ class RouteOptimizer:
 
             logger.info(f"Successfully geocoded {len(valid_stops)} out of {len(stops)} stops")
 
-            # Step 2: Get distance matrix from Google Maps
-            distance_matrix, duration_matrix = self.gmaps_service.get_route_optimization_matrix(
-                depot_coords, valid_coords
-            )
+            # Condense stops sharing a (normalized) address into one node so the
+            # matrix and solver work on the smaller graph; the solution is
+            # expanded back to original stop indices below
+            groups: Dict[str, List[int]] = {}
+            for i, stop in enumerate(valid_stops):
+                groups.setdefault(_normalize_address(stop.address), []).append(i)
+
+            node_expansion: Optional[List[List[int]]] = None
+            solve_stops, solve_coords = valid_stops, valid_coords
+            if len(groups) < len(valid_stops):
+                merged_stops = []
+                merged_coords = []
+                node_expansion = []
+                for indices in groups.values():
+                    first = valid_stops[indices[0]]
+                    merged_stops.append(StopModel(
+                        address=first.address,
+                        passengers=[p for idx in indices for p in valid_stops[idx].passengers],
+                        wheelchair=any(valid_stops[idx].wheelchair for idx in indices)
+                    ))
+                    merged_coords.append(valid_coords[indices[0]])
+                    node_expansion.append([idx + 1 for idx in indices])
+                solve_stops, solve_coords = merged_stops, merged_coords
+                logger.info(f"Condensed {len(valid_stops)} stops into {len(solve_stops)} unique addresses")
+
+            # Step 2: Get distance matrix from Google Maps (cached across
+            # re-runs of the same stop set, e.g. with different vehicle counts)
+            matrix_key = _matrix_cache_key([depot_coords] + solve_coords)
+            cached_matrices = self._load_matrix_cache(matrix_key)
+            if cached_matrices is not None:
+                distance_matrix, duration_matrix = cached_matrices
+            else:
+                distance_matrix, duration_matrix = self.gmaps_service.get_route_optimization_matrix(
+                    depot_coords, solve_coords
+                )
+                self._save_matrix_cache(matrix_key, (distance_matrix, duration_matrix))
+
+            # Trivial instances need no solver: one stop has exactly one tour
+            # and two stops have two, so enumerate directly. The front-seat cap
+            # is order-independent for one vehicle, so the shortcut applies
+            # whenever it is absent or trivially satisfied.
+            if len(solve_stops) == 1 or (len(solve_stops) == 2 and num_vehicles == 1):
+                regular_total = sum(
+                    0 if s.wheelchair else len(s.passengers) for s in solve_stops
+                )
+                if (max_regular_non_wheelchair is None
+                        or regular_total <= max_regular_non_wheelchair):
+                    result = self._trivial_route(
+                        distance_matrix, duration_matrix, solve_stops
+                    )
+                    if node_expansion is not None:
+                        for route in result['vehicle_routes']:
+                            route['stops'] = [
+                                orig for node in route['stops'] for orig in node_expansion[node - 1]
+                            ]
+                        result['route_sequence'] = [
+                            orig
+                            for node in result['route_sequence']
+                            for orig in ([0] if node == 0 else node_expansion[node - 1])
+                        ]
+                    result['geocoding_errors'] = geocoding_errors
+                    return result
 
             # Step 3: Run optimization
             if num_vehicles == 1:
@@ -248,7 +939,7 @@ class RouteOptimizer:
                 result = self._optimize_single_vehicle(
                     distance_matrix,
                     duration_matrix,
-                    valid_stops,
+                    solve_stops,
                     max_regular_non_wheelchair=max_regular_non_wheelchair
                 )
             else:
@@ -256,11 +947,24 @@ class RouteOptimizer:
                 result = self._optimize_multi_vehicle(
                     distance_matrix,
                     duration_matrix,
-                    valid_stops,
+                    solve_stops,
                     num_vehicles,
                     max_regular_non_wheelchair=max_regular_non_wheelchair
                 )
 
+            # Expand condensed nodes back to the caller's original stop indices
+            if node_expansion is not None:
+                for route in result['vehicle_routes']:
+                    route['stops'] = [
+                        orig for node in route['stops'] for orig in node_expansion[node - 1]
+                    ]
+                if result.get('route_sequence'):
+                    result['route_sequence'] = [
+                        orig
+                        for node in result['route_sequence']
+                        for orig in ([0] if node == 0 else node_expansion[node - 1])
+                    ]
+
             # Add geocoding errors to result
             result['geocoding_errors'] = geocoding_errors
             return result
@@ -283,20 +987,92 @@ class RouteOptimizer:
             Tuple of (depot_coords, stop_coords_list, error_messages)
         """
         geocoding_errors = []
+        new_entries: Dict[str, Tuple[float, float]] = {}
+
+        # Check caches first
+        depot_key = _normalize_address(self.depot_address)
+        depot_coords = self._geo_cache.get(depot_key)
+
+        stop_coords: List[Optional[Tuple[float, float]]] = [None] * len(stop_addresses)
+        miss_indices = []
+        for i, address in enumerate(stop_addresses):
+            cached = self._geo_cache.get(_normalize_address(address))
+            if cached is not None:
+                stop_coords[i] = cached
+            else:
+                miss_indices.append(i)
+
+        # Fetch depot and stop misses concurrently so the depot round trip
+        # overlaps the batch request instead of preceding it
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            depot_future = None
+            stops_future = None
+            if depot_coords is None:
+                depot_future = executor.submit(
+                    self.gmaps_service.geocode_address, self.depot_address
+                )
+            if miss_indices:
+                stops_future = executor.submit(
+                    self.gmaps_service.geocode_addresses,
+                    [stop_addresses[i] for i in miss_indices]
+                )
 
-        # Geocode depot
-        try:
-            depot_coords = self.gmaps_service.geocode_address(self.depot_address)
-        except ValueError as e:
-            logger.error(f"Failed to geocode depot: {e}")
-            depot_coords = None
-            geocoding_errors.append(f"Depot: {self.depot_address} - {e}")
+            if depot_future is not None:
+                try:
+                    depot_coords = depot_future.result()
+                    self._geo_cache[depot_key] = depot_coords
+                    new_entries[depot_key] = depot_coords
+                except ValueError as e:
+                    logger.error(f"Failed to geocode depot: {e}")
+                    depot_coords = None
+                    geocoding_errors.append(f"Depot: {self.depot_address} - {e}")
+
+            if stops_future is not None:
+                fetched = stops_future.result()
+                for i, coords in zip(miss_indices, fetched):
+                    stop_coords[i] = coords
+                    if coords is not None:
+                        key = _normalize_address(stop_addresses[i])
+                        self._geo_cache[key] = coords
+                        new_entries[key] = coords
 
-        # Geocode stops
-        stop_coords = self.gmaps_service.geocode_addresses(stop_addresses)
+        self._save_geocode_cache(new_entries)
 
         return depot_coords, stop_coords, geocoding_errors
 
+    def _trivial_route(
+        self,
+        distance_matrix,
+        duration_matrix,
+        stops: List[StopModel]
+    ) -> Dict[str, Any]:
+        """Build the result for a one- or two-stop instance directly: the only
+        choice is which of at most two tours is shorter"""
+        dm, tm = _sanitize_matrices(distance_matrix, duration_matrix)
+        if len(stops) == 1:
+            route = [0, 1, 0]
+        else:
+            forward = int(tm[0, 1]) + int(tm[1, 2]) + int(tm[2, 0])
+            backward = int(tm[0, 2]) + int(tm[2, 1]) + int(tm[1, 0])
+            route = [0, 1, 2, 0] if forward <= backward else [0, 2, 1, 0]
+
+        nodes = np.asarray(route, dtype=np.int32)
+        total_distance_m = int(dm[nodes[:-1], nodes[1:]].sum())
+        total_duration_s = int(tm[nodes[:-1], nodes[1:]].sum())
+        return {
+            'route_sequence': route,
+            'total_distance': total_distance_m,
+            'total_duration': total_duration_s,
+            'is_feasible': True,
+            'vehicle_routes': [{
+                'vehicle_id': 0,
+                'stops': route[1:-1],
+                'distance': total_distance_m,
+                'duration': total_duration_s,
+                'load': sum(len(stop.passengers) for stop in stops)
+            }]
+        }
+
     def _optimize_single_vehicle(
         self,
         distance_matrix: List[List[Optional[int]]],
@@ -308,64 +1084,79 @@ class RouteOptimizer:
         Optimize route for single vehicle (TSP)
         """
         try:
-            n = len(stops) + 1  # +1 for depot
-            manager = pywrapcp.RoutingIndexManager(n, 1, 0)
-            routing = pywrapcp.RoutingModel(manager)
-
-            # Use duration as the optimization cost while still tracking distance
-            def duration_cost_callback(from_index, to_index):
-                from_node = manager.IndexToNode(from_index)
-                to_node = manager.IndexToNode(to_index)
-
-                # Handle None values in duration matrix
-                duration = duration_matrix[from_node][to_node]
-                if duration is None:
-                    return 999999  # Large penalty for unreachable locations
-                return int(duration)
-
-            transit_callback_index = routing.RegisterTransitCallback(duration_cost_callback)
-            routing.SetArcCostEvaluatorOfAllVehicles(transit_callback_index)
-
-            # Optionally add a capacity dimension to limit non-wheelchair passengers (e.g., front seat only)
-            if max_regular_non_wheelchair is not None:
-                def regular_demand_callback(from_index):
-                    from_node = manager.IndexToNode(from_index)
-                    if from_node == 0:
-                        return 0
-                    stop = stops[from_node - 1]
-                    return 0 if stop.wheelchair else len(stop.passengers)
-
-                regular_demand_index = routing.RegisterUnaryTransitCallback(regular_demand_callback)
-                routing.AddDimensionWithVehicleCapacity(
-                    regular_demand_index,
-                    0,
-                    [max_regular_non_wheelchair],
-                    True,
-                    'RegularFrontSeat'
+            dm, tm = _sanitize_matrices(distance_matrix, duration_matrix)
+
+            # Tiny instances: skip OR-Tools setup entirely. The front-seat cap
+            # is order-independent for one vehicle, so the shortcut applies
+            # whenever that constraint is absent or trivially satisfied.
+            if len(stops) <= _SMALL_TSP_MAX_STOPS:
+                regular_total = sum(
+                    0 if s.wheelchair else len(s.passengers) for s in stops
                 )
-
-            # Add a time dimension to balance per-van route duration (minimize max route time)
+                if (max_regular_non_wheelchair is None
+                        or regular_total <= max_regular_non_wheelchair):
+                    route = _small_tsp_route(tm)
+                    nodes = np.asarray(route, dtype=np.int32)
+                    total_distance_m = int(dm[nodes[:-1], nodes[1:]].sum())
+                    total_duration_s = int(tm[nodes[:-1], nodes[1:]].sum())
+                    return {
+                        'route_sequence': route,
+                        'total_distance': total_distance_m,
+                        'total_duration': total_duration_s,
+                        'is_feasible': True,
+                        'vehicle_routes': [{
+                            'vehicle_id': 0,
+                            'stops': route[1:-1],
+                            'distance': total_distance_m,
+                            'duration': total_duration_s,
+                            'load': sum(len(stop.passengers) for stop in stops)
+                        }]
+                    }
+
+            # Driving times are near-symmetric, and a symmetric cost matrix is
+            # what CHRISTOFIDES (and the tour-improvement moves generally)
+            # are built for; the true asymmetric matrices still produce the
+            # reported totals below
+            sym = ((tm.astype(np.int64) + tm.T) // 2).astype(np.int32)
+            tm_list = sym.tolist()
+
+            regular_demands = None
+            if max_regular_non_wheelchair is not None:
+                regular_demands = [
+                    0
+                ] + [0 if s.wheelchair else len(s.passengers) for s in stops]
+
+            # Multi-start: the routing solver is single-threaded, so run one
+            # restart per first-solution strategy on separate cores and keep
+            # the cheapest result
+            candidates = []
             try:
-                routing.AddDimension(
-                    transit_callback_index,
-                    0,           # no waiting/slack
-                    10**7,       # large upper bound on per-vehicle time
-                    True,        # start cumul to zero
-                    'Time'
-                )
-                time_dimension = routing.GetDimensionOrDie('Time')
-                time_dimension.SetGlobalSpanCostCoefficient(100)
+                max_workers = min(len(_PORTFOLIO_STRATEGIES), os.cpu_count() or 1)
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    futures = [
+                        executor.submit(
+                            _solve_tsp_candidate,
+                            tm_list,
+                            strategy,
+                            10,
+                            regular_demands,
+                            max_regular_non_wheelchair
+                        )
+                        for strategy in _PORTFOLIO_STRATEGIES
+                    ]
+                    candidates = [f.result() for f in futures]
             except Exception as e:
-                logger.warning(f"Failed to add time dimension for balancing: {e}")
-
-            search_parameters = pywrapcp.DefaultRoutingSearchParameters()
-            search_parameters.first_solution_strategy = (
-                routing_enums_pb2.FirstSolutionStrategy.PATH_CHEAPEST_ARC)
-            search_parameters.time_limit.seconds = 10
-
-            solution = routing.SolveWithParameters(search_parameters)
-
-            if not solution:
+                logger.warning(f"Parallel multi-start failed, solving in-process: {e}")
+                candidates = [_solve_tsp_candidate(
+                    tm_list,
+                    routing_enums_pb2.FirstSolutionStrategy.PATH_CHEAPEST_ARC,
+                    10,
+                    regular_demands,
+                    max_regular_non_wheelchair
+                )]
+
+            candidates = [c for c in candidates if c is not None]
+            if not candidates:
                 return {
                     'route_sequence': [],
                     'total_distance': 0,
@@ -373,27 +1164,11 @@ class RouteOptimizer:
                     'vehicle_routes': []
                 }
 
-            # Extract route
-            index = routing.Start(0)
-            route = []
-            total_distance_m = 0
-            total_duration_s = 0
+            _, route = min(candidates, key=lambda c: c[0])
 
-            while not routing.IsEnd(index):
-                from_node_index = manager.IndexToNode(index)
-                route.append(from_node_index)
-                previous_index = index
-                index = solution.Value(routing.NextVar(index))
-                to_node_index = manager.IndexToNode(index)
-                # Sum both distance and duration from matrices
-                edge_distance = distance_matrix[from_node_index][to_node_index]
-                edge_duration = duration_matrix[from_node_index][to_node_index]
-                if edge_distance is not None:
-                    total_distance_m += int(edge_distance)
-                if edge_duration is not None:
-                    total_duration_s += int(edge_duration)
-
-            route.append(manager.IndexToNode(index))  # End at depot
+            nodes = np.asarray(route, dtype=np.int32)
+            total_distance_m = int(dm[nodes[:-1], nodes[1:]].sum())
+            total_duration_s = int(tm[nodes[:-1], nodes[1:]].sum())
 
             return {
                 'route_sequence': route,
@@ -431,66 +1206,60 @@ class RouteOptimizer:
         """
         try:
             n = len(stops) + 1  # +1 for depot
-            manager = pywrapcp.RoutingIndexManager(n, num_vehicles, 0)
-            routing = pywrapcp.RoutingModel(manager)
-
-            # Use duration as the optimization cost while still tracking distance
-            def duration_cost_callback(from_index, to_index):
-                from_node = manager.IndexToNode(from_index)
-                to_node = manager.IndexToNode(to_index)
-
-                duration = duration_matrix[from_node][to_node]
-                if duration is None:
-                    return 999999
-                return int(duration)
-
-            transit_callback_index = routing.RegisterTransitCallback(duration_cost_callback)
-            routing.SetArcCostEvaluatorOfAllVehicles(transit_callback_index)
-
-            # Add capacity constraints
-            def demand_callback(from_index):
-                from_node = manager.IndexToNode(from_index)
-                if from_node == 0:  # Depot
-                    return 0
-                return len(stops[from_node - 1].passengers)
-
-            demand_callback_index = routing.RegisterUnaryTransitCallback(demand_callback)
-            routing.AddDimensionWithVehicleCapacity(
-                demand_callback_index,
-                0,  # null capacity slack
-                [self.vehicle_capacity] * num_vehicles,  # vehicle maximum capacities
-                True,  # start cumul to zero
-                'Capacity'
-            )
-
-            # Optionally add a second capacity dimension to limit non-wheelchair passengers per vehicle
+            dm, tm = _sanitize_matrices(distance_matrix, duration_matrix)
+            tm_list = tm.tolist()
+
+            # SoA demand layout: one pass over the stop models, after which
+            # demand vectors and load sums are flat array reads with no
+            # per-node attribute chains
+            passenger_counts = np.zeros(n, dtype=np.int32)
+            is_wheelchair = np.zeros(n, dtype=bool)
+            for node, stop in enumerate(stops, start=1):
+                passenger_counts[node] = len(stop.passengers)
+                is_wheelchair[node] = bool(stop.wheelchair)
+
+            demands = passenger_counts.tolist()
+            regular_demands = None
             if max_regular_non_wheelchair is not None:
-                def regular_demand_callback(from_index):
-                    from_node = manager.IndexToNode(from_index)
-                    if from_node == 0:
-                        return 0
-                    stop = stops[from_node - 1]
-                    return 0 if stop.wheelchair else len(stop.passengers)
-
-                regular_demand_index = routing.RegisterUnaryTransitCallback(regular_demand_callback)
-                routing.AddDimensionWithVehicleCapacity(
-                    regular_demand_index,
-                    0,
-                    [max_regular_non_wheelchair] * num_vehicles,
-                    True,
-                    'RegularFrontSeat'
-                )
-
-            search_parameters = pywrapcp.DefaultRoutingSearchParameters()
-            search_parameters.first_solution_strategy = (
-                routing_enums_pb2.FirstSolutionStrategy.PARALLEL_CHEAPEST_INSERTION)
-            search_parameters.local_search_metaheuristic = (
-                routing_enums_pb2.LocalSearchMetaheuristic.GUIDED_LOCAL_SEARCH)
-            search_parameters.time_limit.seconds = 15
+                regular_demands = np.where(is_wheelchair, 0, passenger_counts).tolist()
 
-            solution = routing.SolveWithParameters(search_parameters)
-
-            if not solution:
+            # Multi-start: the routing solver is single-threaded, so run one
+            # restart per first-solution strategy on separate cores and keep
+            # the cheapest result
+            candidates = []
+            try:
+                max_workers = min(len(_VRP_PORTFOLIO_STRATEGIES), os.cpu_count() or 1)
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    futures = [
+                        executor.submit(
+                            _solve_vrp_candidate,
+                            tm_list,
+                            num_vehicles,
+                            self.vehicle_capacity,
+                            demands,
+                            regular_demands,
+                            max_regular_non_wheelchair,
+                            strategy,
+                            8
+                        )
+                        for strategy in _VRP_PORTFOLIO_STRATEGIES
+                    ]
+                    candidates = [f.result() for f in futures]
+            except Exception as e:
+                logger.warning(f"Parallel multi-start failed, solving in-process: {e}")
+                candidates = [_solve_vrp_candidate(
+                    tm_list,
+                    num_vehicles,
+                    self.vehicle_capacity,
+                    demands,
+                    regular_demands,
+                    max_regular_non_wheelchair,
+                    routing_enums_pb2.FirstSolutionStrategy.PARALLEL_CHEAPEST_INSERTION,
+                    15
+                )]
+
+            candidates = [c for c in candidates if c is not None]
+            if not candidates:
                 return {
                     'route_sequence': [],
                     'total_distance': 0,
@@ -498,31 +1267,18 @@ class RouteOptimizer:
                     'vehicle_routes': []
                 }
 
-            # Extract routes for each vehicle
+            _, routes = min(candidates, key=lambda c: c[0])
+
+            # Edge sums are vectorized over each collected node sequence
+            # rather than accumulated per step
             vehicle_routes = []
             total_distance_m = 0
             total_duration_s = 0
 
-            for vehicle_id in range(num_vehicles):
-                index = routing.Start(vehicle_id)
-                route = []
-                route_distance_m = 0
-                route_duration_s = 0
-
-                while not routing.IsEnd(index):
-                    from_node_index = manager.IndexToNode(index)
-                    route.append(from_node_index)
-                    previous_index = index
-                    index = solution.Value(routing.NextVar(index))
-                    to_node_index = manager.IndexToNode(index)
-                    edge_distance = distance_matrix[from_node_index][to_node_index]
-                    edge_duration = duration_matrix[from_node_index][to_node_index]
-                    if edge_distance is not None:
-                        route_distance_m += int(edge_distance)
-                    if edge_duration is not None:
-                        route_duration_s += int(edge_duration)
-
-                route.append(manager.IndexToNode(index))  # End at depot
+            for vehicle_id, route in enumerate(routes):
+                nodes = np.asarray(route, dtype=np.int32)
+                route_distance_m = int(dm[nodes[:-1], nodes[1:]].sum())
+                route_duration_s = int(tm[nodes[:-1], nodes[1:]].sum())
 
                 if len(route) > 2:  # More than just depot -> depot
                     vehicle_routes.append({
@@ -530,7 +1286,7 @@ class RouteOptimizer:
                         'stops': route[1:-1],  # Exclude depot
                         'distance': route_distance_m,
                         'duration': route_duration_s,
-                        'load': sum(len(stops[node-1].passengers) for node in route[1:-1])
+                        'load': int(passenger_counts[nodes[1:-1]].sum())
                     })
                     total_distance_m += route_distance_m
                     total_duration_s += route_duration_s
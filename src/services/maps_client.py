@@ -3,14 +3,153 @@ Google Maps API Service for NES Van Route Optimization (clean copy)
 Handles geocoding and distance matrix calculations
 """
 
+import asyncio
+import math
 import os
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple, Optional, Dict, Any
 from functools import lru_cache
-import time
+
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Imported once at module load; sys.modules makes repeat imports cheap, but
+# hoisting also drops the per-instantiation try/except preamble
+try:
+    import googlemaps  # type: ignore
+    from googlemaps.exceptions import ApiError, TransportError, Timeout  # type: ignore
+    _GOOGLEMAPS_IMPORT_ERROR = None
+except ImportError as _e:
+    googlemaps = None
+    _GOOGLEMAPS_IMPORT_ERROR = _e
+
+# Optional: only the async geocode path needs it
+try:
+    import aiohttp  # type: ignore
+except ImportError:
+    aiohttp = None
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+# googlemaps parses every payload through response.json() (requests' stdlib
+# decoder) and never consults a module-level json attribute, so the only way
+# to swap decoders is on the response itself
+if googlemaps is not None and orjson is not None:
+    class _MapsClient(googlemaps.Client):
+        """googlemaps.Client that decodes response bodies with orjson; the
+        bound json attribute shadows the Response method, and the parent's
+        status and API-error handling run unchanged"""
+
+        def _get_body(self, response):
+            response.json = lambda: orjson.loads(response.content)
+            return super()._get_body(response)
+else:
+    _MapsClient = googlemaps.Client if googlemaps is not None else None
+
+from src.services.matrix_cache import EdgeCache
+from src.services.rate_limit import TokenBucket
 
 logger = logging.getLogger(__name__)
 
+_SESSION: Optional[requests.Session] = None
+
+
+def _shared_session() -> requests.Session:
+    """Process-wide keep-alive session handed to every googlemaps.Client so
+    geocode and distance calls reuse TCP/TLS connections instead of paying a
+    handshake per request"""
+    global _SESSION
+    if _SESSION is None:
+        session = requests.Session()
+        session.headers["Connection"] = "keep-alive"
+        session.mount("https://", HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=64,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.25,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        ))
+        _SESSION = session
+    return _SESSION
+
+
+# Sentinel for unreachable location pairs in the dense int32 matrices; large
+# enough that no real driving distance or duration ever reaches it
+UNREACHABLE = 2_000_000_000
+
+# REST endpoint for the async geocode path, which bypasses the synchronous
+# googlemaps client
+_GEOCODE_URL = "https://maps.googleapis.com/maps/api/geocode/json"
+
+# Routes API v2 matrix endpoint: one POST covers up to 625 elements versus
+# the legacy Distance Matrix API's 100
+_ROUTES_MATRIX_URL = "https://routes.googleapis.com/distanceMatrix/v2:computeRouteMatrix"
+
+
+def _normalize_address(address: str) -> str:
+    """Lowercase and collapse whitespace so trivially different spellings of
+    the same address share one geocode cache entry"""
+    return " ".join(address.strip().lower().split())
+
+
+def _format_coords(coords: List[Tuple[float, float]]) -> List[str]:
+    """Vectorized "lat,lng" formatting (6 decimals, ~11cm); np.char keeps the
+    per-element work in NumPy's C loops instead of a Python f-string each"""
+    if not coords:
+        return []
+    arr = np.asarray(coords, dtype=np.float64)
+    lat = np.char.mod('%.6f', arr[:, 0])
+    lng = np.char.mod('%.6f', arr[:, 1])
+    return np.char.add(np.char.add(lat, ','), lng).tolist()
+
+
+def _haversine_m_matrix(
+    origins: List[Tuple[float, float]],
+    destinations: List[Tuple[float, float]]
+) -> np.ndarray:
+    """Great-circle distances in meters for every origin/destination pair,
+    vectorized over the full cross product"""
+    o = np.radians(np.asarray(origins, dtype=np.float64))
+    d = np.radians(np.asarray(destinations, dtype=np.float64))
+    dlat = d[np.newaxis, :, 0] - o[:, np.newaxis, 0]
+    dlng = d[np.newaxis, :, 1] - o[:, np.newaxis, 1]
+    a = (
+        np.sin(dlat / 2.0) ** 2
+        + np.cos(o[:, np.newaxis, 0]) * np.cos(d[np.newaxis, :, 0]) * np.sin(dlng / 2.0) ** 2
+    )
+    return 6_371_000.0 * 2.0 * np.arcsin(np.sqrt(a))
+
+
+def _best_chunk_shape(num_origins: int, num_destinations: int) -> Tuple[int, int]:
+    """Pick the chunk shape that minimizes Distance Matrix requests under the
+    API limits (at most 100 elements and 25 origins/destinations per request).
+
+    Balancing both sides matters: a 30x30 matrix needs nine 10x10 chunks but
+    sixteen if naively tiled 25x4.
+    """
+    best_shape = (1, 1)
+    best_requests = None
+    for rows_chunk in range(1, min(25, num_origins) + 1):
+        cols_chunk = min(25, num_destinations, 100 // rows_chunk)
+        requests_needed = (
+            math.ceil(num_origins / rows_chunk)
+            * math.ceil(num_destinations / cols_chunk)
+        )
+        if best_requests is None or requests_needed < best_requests:
+            best_requests = requests_needed
+            best_shape = (rows_chunk, cols_chunk)
+    return best_shape
+
+
 class GoogleMapsService:
     """Service for interacting with Google Maps API for geocoding and distance matrix"""
 
@@ -30,30 +169,50 @@ class GoogleMapsService:
         if any((c == "\x00" or ord(c) < 32) for c in self.api_key):
             raise ValueError("Google Maps API key contains invalid characters. Please paste a clean plain-text key.")
 
-        # Lazy import to avoid app startup failures when dependency is missing
-        try:
-            import googlemaps  # type: ignore
-            from googlemaps.exceptions import ApiError, TransportError, Timeout  # type: ignore
-        except ImportError as e:
-            raise ImportError("googlemaps package not found. Install with: pip install googlemaps") from e
+        if googlemaps is None:
+            raise ImportError(
+                "googlemaps package not found. Install with: pip install googlemaps"
+            ) from _GOOGLEMAPS_IMPORT_ERROR
 
         self._api_exceptions = (ApiError, TransportError, Timeout)
-        self.client = googlemaps.Client(key=self.api_key)
-
-        # Rate limiting: Google Maps allows 40 requests per second
-        self.last_request_time = 0
-        self.min_request_interval = 1.0 / 40.0  # 40 requests per second max
-
-    def _rate_limit(self):
-        """Enforce rate limiting"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last
-            time.sleep(sleep_time)
-        self.last_request_time = time.time()
-
-    @lru_cache(maxsize=1000)
+        self.session = _shared_session()
+        self.client = _MapsClient(
+            key=self.api_key,
+            requests_session=self.session,
+            retry_over_query_limit=True,
+            # (connect, read) split so a hung socket cannot stall a batch
+            # for the full read budget
+            timeout=(3, 10),
+            retry_timeout=30,
+        )
+
+        # Rate limiting: Google Maps allows 40 requests per second. The token
+        # bucket stays accurate under the threaded fan-out and lets bursts
+        # proceed without serializing every request behind a sleep.
+        self._bucket = TokenBucket(capacity=40, refill_rate=40.0)
+
+        # Per-edge persistent cache: repeat runs only pay the API for
+        # coordinate pairs they have not seen before
+        self._edge_cache = EdgeCache()
+
+        # Per-instance geocode memo: decorating the bound helper here instead
+        # of the method keeps the cache (and its strong refs) tied to this
+        # instance's lifetime rather than the class
+        self._geocode_cache = lru_cache(maxsize=1000)(self._geocode_uncached)
+
+    def _with_retries(self, call, *args, **kwargs):
+        """Retry transient transport failures with exponential backoff; the
+        client's built-in retry only covers rate-limit statuses"""
+        for attempt in range(3):
+            try:
+                return call(*args, **kwargs)
+            except (TransportError, Timeout) as e:  # type: ignore[misc]
+                if attempt == 2:
+                    raise
+                wait = 0.25 * (2 ** attempt)
+                logger.warning(f"Transient Maps API error ({e}); retrying in {wait:.2f}s")
+                time.sleep(wait)
+
     def geocode_address(self, address: str) -> Tuple[float, float]:
         """
         Geocode a single address to latitude, longitude
@@ -67,9 +226,13 @@ class GoogleMapsService:
         Raises:
             ValueError: If address cannot be geocoded
         """
+        return self._geocode_cache(_normalize_address(address))
+
+    def _geocode_uncached(self, address: str) -> Tuple[float, float]:
+        """Issue the actual geocode request; callers go through the memo"""
         try:
-            self._rate_limit()
-            result = self.client.geocode(address)
+            self._bucket.acquire()
+            result = self._with_retries(self.client.geocode, address)
 
             if not result:
                 raise ValueError(f"Could not geocode address: {address}")
@@ -94,30 +257,110 @@ class GoogleMapsService:
         Returns:
             List of (latitude, longitude) tuples in same order as input
         """
-        coordinates = []
-        failed_addresses = []
+        if not addresses:
+            return []
 
-        for address in addresses:
+        def geocode_or_none(address):
             try:
-                coords = self.geocode_address(address)
-                coordinates.append(coords)
+                return self.geocode_address(address)
             except ValueError as e:
                 logger.warning(f"Failed to geocode: {address} - {e}")
-                failed_addresses.append(address)
-                # Add None placeholder to maintain order
-                coordinates.append(None)
+                # None placeholder maintains order
+                return None
+
+        # Collapse duplicates before hitting the network: route CSVs commonly
+        # repeat one pickup address for every passenger boarding there, so a
+        # batch of N addresses often has far fewer unique lookups
+        normalized = [_normalize_address(a) for a in addresses]
+        unique = list(dict.fromkeys(normalized))
 
+        # Geocoding is pure IO: fan the unique lookups out over the shared
+        # keep-alive session, then map results back to the input order
+        with ThreadPoolExecutor(max_workers=min(16, len(unique))) as executor:
+            unique_coords = dict(zip(unique, executor.map(geocode_or_none, unique)))
+
+        coordinates = [unique_coords[n] for n in normalized]
+
+        failed_addresses = [a for a, c in zip(addresses, coordinates) if c is None]
         if failed_addresses:
             logger.warning(f"Failed to geocode {len(failed_addresses)} addresses: {failed_addresses}")
 
         return coordinates
 
+    async def _geocode_address_async(
+        self,
+        session: "aiohttp.ClientSession",
+        semaphore: "asyncio.Semaphore",
+        address: str
+    ) -> Tuple[float, float]:
+        """Async twin of geocode_address; talks to the REST endpoint directly
+        since the googlemaps client is synchronous"""
+        params = {"address": address, "key": self.api_key}
+        async with semaphore:
+            async with session.get(_GEOCODE_URL, params=params) as resp:
+                resp.raise_for_status()
+                payload = await resp.json()
+        results = payload.get("results")
+        if not results:
+            raise ValueError(f"Could not geocode address: {address}")
+        location = results[0]["geometry"]["location"]
+        return (location["lat"], location["lng"])
+
+    async def geocode_addresses_async(
+        self,
+        addresses: List[str]
+    ) -> List[Optional[Tuple[float, float]]]:
+        """
+        Geocode multiple addresses on one event loop
+
+        Cheaper than the thread pool for large batches: every in-flight
+        request is a coroutine, not a thread. Failures map to None, and
+        duplicate addresses are collapsed exactly as in geocode_addresses.
+
+        Args:
+            addresses: List of address strings
+
+        Returns:
+            List of (latitude, longitude) tuples (or None) in input order
+        """
+        if not addresses:
+            return []
+        if aiohttp is None:
+            raise ImportError(
+                "aiohttp package not found. Install with: pip install aiohttp"
+            )
+
+        normalized = [_normalize_address(a) for a in addresses]
+        unique = list(dict.fromkeys(normalized))
+
+        # The semaphore caps concurrency at the API's 40 req/s burst size
+        semaphore = asyncio.Semaphore(40)
+        connector = aiohttp.TCPConnector(limit=32)
+        timeout = aiohttp.ClientTimeout(total=30)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            results = await asyncio.gather(
+                *(self._geocode_address_async(session, semaphore, a) for a in unique),
+                return_exceptions=True
+            )
+
+        unique_coords: Dict[str, Optional[Tuple[float, float]]] = {}
+        for address, result in zip(unique, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Failed to geocode: {address} - {result}")
+                unique_coords[address] = None
+            else:
+                unique_coords[address] = result
+
+        return [unique_coords[n] for n in normalized]
+
     def get_distance_matrix(
         self,
         origins: List[Tuple[float, float]],
         destinations: List[Tuple[float, float]],
-        departure_time: Optional[str] = None
-    ) -> Tuple[List[List[Optional[int]]], List[List[Optional[int]]]]:
+        departure_time: Optional[str] = None,
+        upper_triangle_only: bool = False,
+        approximate_threshold_m: Optional[float] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """
         Get distance matrix between multiple origin-destination pairs
 
@@ -125,85 +368,235 @@ class GoogleMapsService:
             origins: List of (lat, lng) tuples for origins
             destinations: List of (lat, lng) tuples for destinations
             departure_time: ISO 8601 formatted time for traffic-aware routing (optional)
+            upper_triangle_only: Fetch only chunks touching the upper triangle
+                and mirror the rest; callers assert symmetry (square matrices only)
+            approximate_threshold_m: Pairs closer than this (great-circle) are
+                estimated as haversine * 1.3 at ~30 km/h instead of fetched;
+                None disables the approximation
 
         Returns:
-            Tuple of (distance_matrix, duration_matrix) where each is a 2D list
-            Values are in meters and seconds respectively, None if route not found
+            Tuple of (distance_matrix, duration_matrix) as dense int32 arrays
+            Values are in meters and seconds respectively, UNREACHABLE if no route
         """
         try:
-            self._rate_limit()
-
             num_origins = len(origins)
             num_destinations = len(destinations)
 
-            # Initialize full matrices with None
-            distance_matrix: List[List[Optional[int]]] = [
-                [None for _ in range(num_destinations)] for _ in range(num_origins)
-            ]
-            duration_matrix: List[List[Optional[int]]] = [
-                [None for _ in range(num_destinations)] for _ in range(num_origins)
+            # Dense int32 matrices pre-filled with the sentinel: far smaller
+            # than nested lists of boxed ints and contiguous for the solver
+            distance_matrix = np.full(
+                (num_origins, num_destinations), UNREACHABLE, dtype=np.int32
+            )
+            duration_matrix = np.full(
+                (num_origins, num_destinations), UNREACHABLE, dtype=np.int32
+            )
+
+            rows_chunk, cols_chunk = _best_chunk_shape(num_origins, num_destinations)
+
+            missing = np.ones((num_origins, num_destinations), dtype=bool)
+
+            if approximate_threshold_m:
+                # Nearby pairs never hit the API: driving distance tracks
+                # great-circle * 1.3 closely at this scale, at ~30 km/h
+                hav = _haversine_m_matrix(origins, destinations)
+                near = hav < approximate_threshold_m
+                distance_matrix[near] = (hav[near] * 1.3).astype(np.int32)
+                duration_matrix[near] = (hav[near] * 1.3 / 8.3).astype(np.int32)
+                missing[near] = False
+
+            # Serve already-known edges from the persistent per-edge cache
+            # before any HTTP; only chunks that still contain a missing pair
+            # cost billable elements
+            for i in range(num_origins):
+                for j in range(num_destinations):
+                    if not missing[i, j]:
+                        continue
+                    hit = self._edge_cache.lookup(origins[i], destinations[j])
+                    if hit is not None:
+                        distance_matrix[i, j], duration_matrix[i, j] = hit
+                        missing[i, j] = False
+
+            # Each chunk is an independent HTTPS round trip; fetch up to 8 in
+            # flight at once (the token bucket still gates each request) and
+            # stitch results on the calling thread so the matrices need no lock
+            chunks = [
+                (row_start, min(num_origins, row_start + rows_chunk),
+                 col_start, min(num_destinations, col_start + cols_chunk))
+                for row_start in range(0, num_origins, rows_chunk)
+                for col_start in range(0, num_destinations, cols_chunk)
             ]
+            if upper_triangle_only:
+                # Chunks entirely below the diagonal are mirrored, not fetched
+                chunks = [c for c in chunks if c[3] > c[0]]
+            chunks = [c for c in chunks if missing[c[0]:c[1], c[2]:c[3]].any()]
+
+            # Format each coordinate once per call instead of once per chunk
+            origin_strs_all = _format_coords(origins)
+            dest_strs_all = _format_coords(destinations)
+
+            def fetch_chunk(chunk):
+                return self._distance_matrix_chunk(chunk, origin_strs_all, dest_strs_all, departure_time)
+
+            new_edges = []
+            if chunks:
+                with ThreadPoolExecutor(max_workers=min(8, len(chunks))) as executor:
+                    for row_start, col_start, result_rows in executor.map(fetch_chunk, chunks):
+                        # Collect the whole chunk, then stitch it in with one
+                        # 2-D slice assignment per matrix instead of a Python
+                        # write per cell
+                        dist_block: List[List[int]] = []
+                        dur_block: List[List[int]] = []
+                        for row in result_rows:
+                            elems = row.get("elements", [])
+                            # meters / seconds; comprehensions presize and skip
+                            # the bound-method lookups of an append loop
+                            dist_block.append([
+                                e["distance"]["value"] if e.get("status") == "OK" else UNREACHABLE
+                                for e in elems
+                            ])
+                            dur_block.append([
+                                e["duration"]["value"] if e.get("status") == "OK" else UNREACHABLE
+                                for e in elems
+                            ])
+
+                        if not dist_block:
+                            continue
+                        n_rows = len(dist_block)
+                        n_cols = len(dist_block[0])
+                        distance_matrix[row_start:row_start + n_rows, col_start:col_start + n_cols] = \
+                            np.array(dist_block, dtype=np.int32)
+                        duration_matrix[row_start:row_start + n_rows, col_start:col_start + n_cols] = \
+                            np.array(dur_block, dtype=np.int32)
+                        new_edges.extend(
+                            (origins[row_start + i], destinations[col_start + j], d_val, t_val)
+                            for i, (dist_row, dur_row) in enumerate(zip(dist_block, dur_block))
+                            for j, (d_val, t_val) in enumerate(zip(dist_row, dur_row))
+                            if d_val != UNREACHABLE
+                        )
+            self._edge_cache.store_many(new_edges)
+
+            if upper_triangle_only:
+                # Fill whatever was skipped from its transpose
+                missing = distance_matrix == UNREACHABLE
+                distance_matrix[missing] = distance_matrix.T[missing]
+                duration_matrix[missing] = duration_matrix.T[missing]
 
-            max_elements = 100
-            rows_chunk = min(num_origins, 25)
-            cols_chunk = max_elements // max(1, rows_chunk)
-            cols_chunk = max(1, min(num_destinations, cols_chunk))
-            if rows_chunk * cols_chunk > max_elements:
-                cols_chunk = max_elements // rows_chunk
-                cols_chunk = max(1, cols_chunk)
+            return distance_matrix, duration_matrix
+
+        except Exception as e:
+            logger.error(f"Failed to get distance matrix: {e}")
+            raise ValueError(f"Failed to get distance matrix: {e}")
+
+    def _distance_matrix_chunk(
+        self,
+        chunk: Tuple[int, int, int, int],
+        origin_strs_all: List[str],
+        destination_strs_all: List[str],
+        departure_time: Optional[str]
+    ) -> Tuple[int, int, List[Dict[str, Any]]]:
+        """Fetch one (row, col) chunk of the matrix; one token per request"""
+        row_start, row_end, col_start, col_end = chunk
+        origin_strs = origin_strs_all[row_start:row_end]
+        dest_strs = destination_strs_all[col_start:col_end]
+
+        self._bucket.acquire()
+
+        params: Dict[str, Any] = {
+            "origins": origin_strs,
+            "destinations": dest_strs,
+            "mode": "driving",
+            "units": "metric",
+        }
+        if departure_time:
+            params["departure_time"] = departure_time
+
+        result = self._with_retries(self.client.distance_matrix, **params)
+
+        if result.get("status") != "OK":
+            raise ValueError(f"Distance matrix API returned status: {result.get('status')}")
+
+        return row_start, col_start, result.get("rows", [])
+
+    def get_distance_matrix_v2(
+        self,
+        origins: List[Tuple[float, float]],
+        destinations: List[Tuple[float, float]]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get distance/duration matrices from the Routes API computeRouteMatrix
+
+        Same contract as get_distance_matrix, but each POST carries up to 625
+        elements (no 25-per-side limit), so a 25x25 matrix is one round trip
+        instead of seven.
+
+        Args:
+            origins: List of (lat, lng) tuples for origins
+            destinations: List of (lat, lng) tuples for destinations
+
+        Returns:
+            Tuple of (distance_matrix, duration_matrix) as dense int32 arrays
+            Values are in meters and seconds respectively, UNREACHABLE if no route
+        """
+        num_origins = len(origins)
+        num_destinations = len(destinations)
 
+        distance_matrix = np.full(
+            (num_origins, num_destinations), UNREACHABLE, dtype=np.int32
+        )
+        duration_matrix = np.full(
+            (num_origins, num_destinations), UNREACHABLE, dtype=np.int32
+        )
+
+        def waypoint(lat: float, lng: float) -> Dict[str, Any]:
+            return {"waypoint": {"location": {"latLng": {"latitude": lat, "longitude": lng}}}}
+
+        headers = {
+            "X-Goog-Api-Key": self.api_key,
+            # Asking only for the fields we read keeps the response minimal
+            "X-Goog-FieldMask": "originIndex,destinationIndex,condition,duration,distanceMeters",
+        }
+
+        # Split origins into row bands so each request stays under the
+        # 625-element cap; destinations always go whole
+        rows_chunk = max(1, 625 // max(1, num_destinations))
+
+        try:
             for row_start in range(0, num_origins, rows_chunk):
                 row_end = min(num_origins, row_start + rows_chunk)
-                origin_block = origins[row_start:row_end]
-                origin_strs = [f"{lat},{lng}" for lat, lng in origin_block]
-
-                for col_start in range(0, num_destinations, cols_chunk):
-                    col_end = min(num_destinations, col_start + cols_chunk)
-                    dest_block = destinations[col_start:col_end]
-                    dest_strs = [f"{lat},{lng}" for lat, lng in dest_block]
-
-                    self._rate_limit()
-
-                    params: Dict[str, Any] = {
-                        "origins": origin_strs,
-                        "destinations": dest_strs,
-                        "mode": "driving",
-                        "units": "metric",
-                    }
-                    if departure_time:
-                        params["departure_time"] = departure_time
-
-                    result = self.client.distance_matrix(**params)
-
-                    if result.get("status") != "OK":
-                        raise ValueError(f"Distance matrix API returned status: {result.get('status')}")
-
-                    for i_row, row in enumerate(result.get("rows", [])):
-                        dist_row: List[Optional[int]] = []
-                        dur_row: List[Optional[int]] = []
-                        for element in row.get("elements", []):
-                            if element.get("status") == "OK":
-                                dist_row.append(element["distance"]["value"])  # meters
-                                dur_row.append(element["duration"]["value"])   # seconds
-                            else:
-                                dist_row.append(None)
-                                dur_row.append(None)
-
-                        for j_col, (d_val, t_val) in enumerate(zip(dist_row, dur_row)):
-                            distance_matrix[row_start + i_row][col_start + j_col] = d_val
-                            duration_matrix[row_start + i_row][col_start + j_col] = t_val
+                body = {
+                    "origins": [waypoint(lat, lng) for lat, lng in origins[row_start:row_end]],
+                    "destinations": [waypoint(lat, lng) for lat, lng in destinations],
+                    "travelMode": "DRIVE",
+                    "routingPreference": "TRAFFIC_AWARE",
+                }
+
+                self._bucket.acquire()
+                response = self.session.post(
+                    _ROUTES_MATRIX_URL, json=body, headers=headers, timeout=(3, 30)
+                )
+                response.raise_for_status()
+
+                for element in response.json():
+                    if element.get("condition") != "ROUTE_EXISTS":
+                        continue
+                    i = row_start + element.get("originIndex", 0)
+                    j = element.get("destinationIndex", 0)
+                    distance_matrix[i, j] = element.get("distanceMeters", 0)
+                    # duration arrives as a "123s" string
+                    duration_matrix[i, j] = int(float(element["duration"].rstrip("s")))
 
             return distance_matrix, duration_matrix
 
         except Exception as e:
-            logger.error(f"Failed to get distance matrix: {e}")
+            logger.error(f"Failed to get Routes API matrix: {e}")
             raise ValueError(f"Failed to get distance matrix: {e}")
 
     def get_route_optimization_matrix(
         self,
         depot_coords: Tuple[float, float],
-        stop_coords: List[Tuple[float, float]]
-    ) -> Tuple[List[List[Optional[int]]], List[List[Optional[int]]]]:
+        stop_coords: List[Tuple[float, float]],
+        assume_symmetric: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """
         Get distance/duration matrix optimized for route planning
         Includes depot as both origin and destination for all stops
@@ -211,11 +604,16 @@ class GoogleMapsService:
         Args:
             depot_coords: (lat, lng) of depot
             stop_coords: List of (lat, lng) for stops
+            assume_symmetric: Treat driving costs as direction-independent and
+                fetch only the upper triangle, halving billable elements.
+                Asymmetry from one-way streets is ignored when set.
 
         Returns:
             Matrix where row 0 and column 0 represent the depot
         """
         all_coords = [depot_coords] + stop_coords
-        return self.get_distance_matrix(all_coords, all_coords)
+        return self.get_distance_matrix(
+            all_coords, all_coords, upper_triangle_only=assume_symmetric
+        )
 
 
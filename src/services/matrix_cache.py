@@ -0,0 +1,90 @@
+"""
+SQLite-backed cache of individual distance-matrix edges.
+
+Keyed on rounded origin/destination coordinates so that re-optimizing a
+slightly edited route only pays the API for the new edges.
+"""
+
+import logging
+import os
+import sqlite3
+import time
+from typing import Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_DB_PATH = os.path.join(".cache", "edges.sqlite")
+
+# Edges older than this are treated as misses (road/traffic data drifts)
+_MAX_AGE_S = 30 * 24 * 3600
+
+
+def _round_coord(coord: Tuple[float, float]) -> Tuple[float, float]:
+    # 6 decimals (~11 cm) avoids float-equality misses on re-geocoded points
+    return (round(coord[0], 6), round(coord[1], 6))
+
+
+class EdgeCache:
+    """Persistent cache of (origin, destination) -> (distance_m, duration_s)"""
+
+    def __init__(self, path: str = _DB_PATH):
+        self.path = path
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS edges ("
+                " from_lat REAL, from_lng REAL, to_lat REAL, to_lng REAL,"
+                " distance INTEGER, duration INTEGER, ts INTEGER,"
+                " PRIMARY KEY (from_lat, from_lng, to_lat, to_lng))"
+            )
+            self._conn.commit()
+        except Exception as e:
+            logger.warning(f"Edge cache unavailable: {e}")
+            self._conn = None
+
+    def lookup(
+        self,
+        origin: Tuple[float, float],
+        dest: Tuple[float, float]
+    ) -> Optional[Tuple[int, int]]:
+        """Return (distance_m, duration_s) for a cached, non-stale edge, else None"""
+        if self._conn is None:
+            return None
+        o = _round_coord(origin)
+        d = _round_coord(dest)
+        try:
+            row = self._conn.execute(
+                "SELECT distance, duration, ts FROM edges"
+                " WHERE from_lat=? AND from_lng=? AND to_lat=? AND to_lng=?",
+                (o[0], o[1], d[0], d[1])
+            ).fetchone()
+        except Exception as e:
+            logger.warning(f"Edge cache lookup failed: {e}")
+            return None
+        if row is None:
+            return None
+        distance, duration, ts = row
+        if time.time() - ts > _MAX_AGE_S:
+            return None
+        return int(distance), int(duration)
+
+    def store_many(
+        self,
+        entries: Iterable[Tuple[Tuple[float, float], Tuple[float, float], int, int]]
+    ) -> None:
+        """Persist an iterable of (origin, dest, distance_m, duration_s) edges"""
+        if self._conn is None:
+            return
+        now = int(time.time())
+        try:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO edges VALUES (?,?,?,?,?,?,?)",
+                [
+                    (*_round_coord(o), *_round_coord(d), int(dist), int(dur), now)
+                    for o, d, dist, dur in entries
+                ]
+            )
+            self._conn.commit()
+        except Exception as e:
+            logger.warning(f"Could not persist edges: {e}")
@@ -0,0 +1,39 @@
+"""
+Thread-safe token-bucket rate limiter for outbound API calls.
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Classic token bucket: allows bursts up to capacity, refills at a steady
+    rate, and is safe to share across the geocode/matrix worker threads"""
+
+    def __init__(self, capacity: int = 40, refill_rate: float = 40.0):
+        """
+        Args:
+            capacity: Maximum tokens held (burst size)
+            refill_rate: Tokens added per second (sustained request rate)
+        """
+        self.capacity = float(capacity)
+        self.refill_rate = float(refill_rate)
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, n: int = 1) -> None:
+        """Take n tokens, sleeping only as long as the bucket is short"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._last_refill) * self.refill_rate
+                )
+                self._last_refill = now
+                if self._tokens >= n:
+                    self._tokens -= n
+                    return
+                wait = (n - self._tokens) / self.refill_rate
+            time.sleep(wait)
@@ -1,22 +1,45 @@
 import pandas as pd
+from pydantic import TypeAdapter
 from src.models.route_models import StopModel
 
+# Built once: validates a whole list of stops in one call to Pydantic's core
+# instead of running the per-row construction path
+STOP_LIST_ADAPTER = TypeAdapter(list[StopModel])
+
 class CSVProcessor:
     REQUIRED_COLUMNS = [
         'stop_id', 'address', 'passenger_name',
         'time_window_start', 'time_window_end', 'passengers'
     ]
+    _REQUIRED_SET = frozenset(REQUIRED_COLUMNS)
     MAX_ROWS = 50
     MAX_FILE_SIZE = 200 * 1024  # 200 KB
 
     def validate_and_process_csv(self, uploaded_file):
         if uploaded_file.size > self.MAX_FILE_SIZE:
             raise ValueError(f"File size exceeds {self.MAX_FILE_SIZE // 1024} KB limit.")
-        df = pd.read_csv(uploaded_file)
-        missing = [col for col in self.REQUIRED_COLUMNS if col not in df.columns]
+        # Sniff just the header first so a malformed file is rejected before
+        # any rows are parsed
+        header = pd.read_csv(uploaded_file, nrows=0)
+        missing = [col for col in self.REQUIRED_COLUMNS if col not in header.columns]
         if missing:
             raise ValueError(f"Missing required columns: {', '.join(missing)}")
+        uploaded_file.seek(0)
+        # Parse only the columns the app consumes with pinned numeric dtypes
+        # so pandas skips type inference, and stop reading one row past the
+        # cap instead of consuming an oversize file before rejecting it
+        df = pd.read_csv(
+            uploaded_file,
+            usecols=lambda col: col in self._REQUIRED_SET,
+            dtype={'stop_id': 'int32', 'passengers': 'int16'},
+            nrows=self.MAX_ROWS + 1,
+        )
         if len(df) > self.MAX_ROWS:
-            raise ValueError(f"File contains {len(df)} rows, max allowed is {self.MAX_ROWS}.")
-        stops = [StopModel(**row) for row in df.to_dict(orient='records')]
+            raise ValueError(f"File contains more than {self.MAX_ROWS} rows, max allowed is {self.MAX_ROWS}.")
+        # itertuples over just the consumed columns beats to_dict('records'),
+        # and the adapter validates the whole batch in one call
+        stops = STOP_LIST_ADAPTER.validate_python([
+            {'address': str(addr), 'passengers': [str(name)], 'wheelchair': False}
+            for addr, name in df[['address', 'passenger_name']].itertuples(index=False, name=None)
+        ])
         return stops 
\ No newline at end of file